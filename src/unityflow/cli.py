@@ -44,13 +44,26 @@ def _normalize_single_file(args: tuple) -> tuple[Path, bool, str]:
     file_path, kwargs = args
     try:
         normalizer = UnityPrefabNormalizer(**kwargs)
-        content = normalizer.normalize_file(file_path)
-        file_path.write_text(content, encoding="utf-8", newline="\n")
+        normalizer.normalize_file_streaming(file_path, file_path)
         return (file_path, True, "")
     except Exception as e:
         return (file_path, False, str(e))
 
 
+def _validate_single_file(args: tuple):
+    """Validate a single file (for parallel processing).
+
+    Args:
+        args: Tuple of (file_path, strict)
+
+    Returns:
+        ValidationResult for the file
+    """
+    file_path, strict = args
+    validator = PrefabValidator(strict=strict)
+    return validator.validate_file(file_path)
+
+
 def create_progress_bar(
     total: int,
     label: str = "Processing",
@@ -205,6 +218,9 @@ def normalize(
         # Normalize multiple files
         unityflow normalize *.prefab *.unity *.asset
 
+        # Normalize every Unity file under a directory, in parallel
+        unityflow normalize Assets/Prefabs -j 8
+
         # Normalize to a new file
         unityflow normalize Player.prefab -o Player.normalized.prefab
 
@@ -267,9 +283,18 @@ def normalize(
                     pass
             files_to_normalize = filtered
 
-    # Explicit file arguments
+    # Explicit file arguments (directories fan out to all Unity YAML files
+    # underneath them, so `normalize Assets/Prefabs -j 8` works)
     if input_files:
-        explicit_files = list(input_files)
+        explicit_files = []
+        for f in input_files:
+            if f.is_dir():
+                explicit_files.extend(
+                    p for p in sorted(f.rglob("*"))
+                    if p.is_file() and p.suffix in UNITY_EXTENSIONS
+                )
+            else:
+                explicit_files.append(f)
         # Apply pattern filter to explicit files too
         if pattern:
             explicit_files = [f for f in explicit_files if f.match(pattern)]
@@ -370,16 +395,15 @@ def normalize(
 
         for input_file in files_iter:
             try:
-                content = normalizer.normalize_file(input_file)
-
                 if stdout:
+                    content = normalizer.normalize_file(input_file)
                     click.echo(content, nl=False)
                 elif output:
-                    output.write_text(content, encoding="utf-8", newline="\n")
+                    normalizer.normalize_file_streaming(input_file, output)
                     if not progress:
                         click.echo(f"Normalized: {input_file} -> {output}")
                 else:
-                    input_file.write_text(content, encoding="utf-8", newline="\n")
+                    normalizer.normalize_file_streaming(input_file, input_file)
                     if not progress:
                         click.echo(f"Normalized: {input_file}")
 
@@ -497,11 +521,20 @@ def diff(
     is_flag=True,
     help="Only output errors, suppress info and warnings",
 )
+@click.option(
+    "--parallel",
+    "-j",
+    "parallel_jobs",
+    type=int,
+    default=1,
+    help="Number of parallel jobs for batch validation (default: 1)",
+)
 def validate(
     files: tuple[Path, ...],
     strict: bool,
     output_format: str,
     quiet: bool,
+    parallel_jobs: int,
 ) -> None:
     """Validate Unity YAML files for structural correctness.
 
@@ -523,19 +556,35 @@ def validate(
 
         # Strict validation (warnings are errors)
         unityflow validate Player.prefab --strict
+
+        # Validate many files in parallel
+        unityflow validate Assets/**/*.prefab -j 8
     """
-    validator = PrefabValidator(strict=strict)
+    import json
+
     any_invalid = False
 
-    for file in files:
-        result = validator.validate_file(file)
+    # Validation is CPU-bound with no shared state between files, so batch
+    # runs can fan out across processes. executor.map preserves input order,
+    # keeping output deterministic regardless of completion order.
+    if parallel_jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=parallel_jobs) as executor:
+            results = list(
+                executor.map(
+                    _validate_single_file,
+                    [(f, strict) for f in files],
+                    chunksize=8,
+                )
+            )
+    else:
+        validator = PrefabValidator(strict=strict)
+        results = [validator.validate_file(f) for f in files]
 
+    for file, result in zip(files, results):
         if not result.is_valid:
             any_invalid = True
 
         if output_format == "json":
-            import json
-
             output = {
                 "path": str(file),
                 "valid": result.is_valid,
@@ -550,7 +599,7 @@ def validate(
                     for i in result.issues
                 ],
             }
-            click.echo(json.dumps(output, indent=2))
+            click.echo(json.dumps(output, indent=2, ensure_ascii=False))
         else:
             if quiet:
                 if result.errors:
@@ -656,7 +705,7 @@ def query(
             return
 
         if output_format == "json":
-            click.echo(json.dumps(results, indent=2))
+            click.echo(json.dumps(results, indent=2, ensure_ascii=False))
         else:
             click.echo(f"Found {len(results)} GameObject(s) matching '{find_name}':")
             for r in results:
@@ -673,7 +722,7 @@ def query(
             return
 
         if output_format == "json":
-            click.echo(json.dumps(results, indent=2))
+            click.echo(json.dumps(results, indent=2, ensure_ascii=False))
         else:
             click.echo(f"Found {len(results)} GameObject(s) with '{find_component}':")
             for r in results:
@@ -694,7 +743,7 @@ def query(
             return
 
         if output_format == "json":
-            click.echo(json.dumps(results, indent=2))
+            click.echo(json.dumps(results, indent=2, ensure_ascii=False))
         else:
             click.echo(f"Found {len(results)} GameObject(s) with script '{find_script}':")
             for r in results:
@@ -705,7 +754,7 @@ def query(
         # Show summary
         summary = get_summary(doc)
         if output_format == "json":
-            click.echo(json.dumps(summary, indent=2))
+            click.echo(json.dumps(summary, indent=2, ensure_ascii=False))
         else:
             s = summary["summary"]
             click.echo(f"File: {file}")
@@ -733,11 +782,11 @@ def query(
 
     if output_format == "json":
         output = [{"path": r.path, "value": r.value} for r in results]
-        click.echo(json.dumps(output, indent=2))
+        click.echo(json.dumps(output, indent=2, ensure_ascii=False))
     else:
         for r in results:
             if isinstance(r.value, (dict, list)):
-                click.echo(f"{r.path}: {json.dumps(r.value)}")
+                click.echo(f"{r.path}: {json.dumps(r.value, ensure_ascii=False)}")
             else:
                 click.echo(f"{r.path}: {r.value}")
 
@@ -1527,6 +1576,94 @@ def set_value_cmd(
         click.echo(f"Saved to: {output}")
 
 
+# Maximum total size of the git-textconv result cache before old entries
+# are evicted (oldest modification time first).
+TEXTCONV_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+
+def _textconv_cache_dir() -> Path:
+    """Get the directory for cached git-textconv results."""
+    import os
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "unityflow" / "textconv"
+
+
+def _textconv_cache_key(file: Path, normalizer: UnityPrefabNormalizer) -> str:
+    """Compute the cache key for a file's normalized content.
+
+    The key covers the file bytes plus everything that influences the
+    normalized output: tool version, normalizer config, and the detected
+    project root (MonoBehaviour field sync depends on project scripts).
+    """
+    import hashlib
+
+    config = (
+        f"{__version__}:{normalizer.use_hex_floats}:{normalizer.float_precision}"
+        f":{normalizer.project_root}"
+    )
+    sha = hashlib.sha1(file.read_bytes())
+    sha.update(config.encode("utf-8"))
+    return sha.hexdigest()
+
+
+def _textconv_cache_get(key: str) -> str | None:
+    """Look up a cached normalization result, or None on miss."""
+    cache_path = _textconv_cache_dir() / key[:2] / key
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _textconv_cache_put(key: str, content: str) -> None:
+    """Store a normalization result in the cache (best-effort)."""
+    import os
+    import tempfile
+
+    cache_dir = _textconv_cache_dir() / key[:2]
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write atomically so a concurrent git process never sees a partial entry
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=cache_dir, delete=False
+        ) as tmp:
+            tmp.write(content)
+        os.replace(tmp.name, cache_dir / key)
+        _prune_textconv_cache()
+    except OSError:
+        # Caching is an optimization - never let it break textconv output
+        pass
+
+
+def _prune_textconv_cache(max_bytes: int = TEXTCONV_CACHE_MAX_BYTES) -> None:
+    """Evict oldest cache entries until total size is under max_bytes."""
+    cache_root = _textconv_cache_dir()
+    entries = []
+    total_size = 0
+    for path in cache_root.glob("*/*"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total_size += stat.st_size
+
+    if total_size <= max_bytes:
+        return
+
+    entries.sort()  # Oldest mtime first
+    for _, size, path in entries:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total_size -= size
+        if total_size <= max_bytes:
+            break
+
+
 @main.command(name="git-textconv")
 @click.argument("file", type=click.Path(exists=True, path_type=Path))
 def git_textconv(file: Path) -> None:
@@ -1549,13 +1686,31 @@ def git_textconv(file: Path) -> None:
     normalizer = UnityPrefabNormalizer()
 
     try:
-        content = normalizer.normalize_file(file)
+        # Resolve project root up front so it participates in the cache key
+        if normalizer.project_root is None:
+            normalizer.project_root = find_unity_project_root(file)
+
+        # Git runs textconv once per side of every diff/log/blame, so the
+        # same unchanged prefab gets re-normalized constantly. Cache results
+        # on disk keyed by content hash + config.
+        key = _textconv_cache_key(file, normalizer)
+        content = _textconv_cache_get(key)
+        if content is None:
+            content = normalizer.normalize_file(file)
+            _textconv_cache_put(key, content)
+
         # Output to stdout without trailing message
         sys.stdout.write(content)
     except Exception as e:
-        # On error, output original file content so git can still diff
+        # On error, output original file content so git can still diff.
+        # Copy raw bytes in chunks - no decode/encode round trip, and no
+        # full-file buffer for large scenes.
+        import shutil
+
         click.echo(f"# Error normalizing: {e}", err=True)
-        sys.stdout.write(file.read_text(encoding="utf-8"))
+        sys.stdout.flush()
+        with file.open("rb") as src:
+            shutil.copyfileobj(src, sys.stdout.buffer)
 
 
 @main.command(name="difftool")
@@ -2078,6 +2233,24 @@ def merge_files(
     """
     from unityflow.merge import three_way_merge
 
+    output_path = output or ours
+
+    # Trivial merges resolve on raw bytes alone - git calls the driver for
+    # every candidate file, so skip the three normalization passes when the
+    # inputs already agree
+    base_bytes = base.read_bytes()
+    ours_bytes = ours.read_bytes()
+    theirs_bytes = theirs.read_bytes()
+
+    if ours_bytes == theirs_bytes or theirs_bytes == base_bytes:
+        # Both sides agree, or they didn't change - keep ours
+        output_path.write_bytes(ours_bytes)
+        sys.exit(0)
+    if ours_bytes == base_bytes:
+        # We didn't change - take theirs
+        output_path.write_bytes(theirs_bytes)
+        sys.exit(0)
+
     normalizer = UnityPrefabNormalizer()
 
     try:
@@ -2091,8 +2264,9 @@ def merge_files(
     # Perform 3-way merge
     result, has_conflict = three_way_merge(base_content, ours_content, theirs_content)
 
-    output_path = output or ours
-    output_path.write_text(result, encoding="utf-8", newline="\n")
+    # Merged content already uses LF line endings; a single pre-encoded
+    # write_bytes avoids the text layer's newline translation pass
+    output_path.write_bytes(result.encode("utf-8"))
 
     display_path = file_path or str(output_path)
 
@@ -2152,7 +2326,7 @@ def stats(
         all_stats.append(file_stats)
 
     if output_format == "json":
-        click.echo(json.dumps(all_stats, indent=2))
+        click.echo(json.dumps(all_stats, indent=2, ensure_ascii=False))
     else:
         for stats in all_stats:
             click.echo(f"File: {stats['path']}")
@@ -2272,7 +2446,7 @@ def deps(
                 and (not unresolved_only or not d.get("resolved"))
                 and (not asset_type or (d.get("type") or "").lower() == asset_type.lower())
             ]
-        click.echo(json.dumps(output_data, indent=2))
+        click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
     else:
         # Text output
         click.echo(f"Dependencies for: {', '.join(str(f) for f in files)}")
@@ -2313,10 +2487,9 @@ def deps(
         if deps_to_show and not asset_type:
             click.echo()
             click.echo("By type:")
-            type_counts: dict[str, int] = {}
-            for dep in deps_to_show:
-                t = dep.asset_type or "Unknown"
-                type_counts[t] = type_counts.get(t, 0) + 1
+            from collections import Counter
+
+            type_counts = Counter(dep.asset_type or "Unknown" for dep in deps_to_show)
             for t, count in sorted(type_counts.items(), key=lambda x: -x[1]):
                 click.echo(f"  {t}: {count}")
 
@@ -2448,7 +2621,7 @@ def find_refs(
                 for file_path, refs in results
             ],
         }
-        click.echo(json.dumps(output_data, indent=2))
+        click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
     else:
         click.echo(f"References to: {asset}")
         click.echo()
@@ -2659,7 +2832,7 @@ def scan_scripts(
                 }
             }
 
-        click.echo(json.dumps(output_data, indent=2))
+        click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
     else:
         # Text output
         click.echo(f"Scanned {len(files_to_scan)} file(s)")
@@ -2878,7 +3051,7 @@ def scan_meta(
                 "scripts": len([r for r in results if r["type"] == "Script"]),
             }
         }
-        click.echo(json.dumps(output_data, indent=2))
+        click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
     else:
         if package_name:
             click.echo(f"Package: {package_name}")
@@ -2973,7 +3146,7 @@ def parse_script_cmd(
             ],
             "fieldOrder": info.get_field_order(),
         }
-        click.echo(json.dumps(output_data, indent=2))
+        click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
     else:
         click.echo(f"Script: {script_path}")
         click.echo(f"Class: {info.class_name}")
@@ -3328,7 +3501,7 @@ def sprite_info_cmd(
                 for s in info.sprites
             ] if info.is_multiple else [],
         }
-        click.echo(json.dumps(output, indent=2))
+        click.echo(json.dumps(output, indent=2, ensure_ascii=False))
     else:
         click.echo(f"Sprite: {sprite}")
         click.echo(f"Mode: {'Single' if info.is_single else 'Multiple'}")
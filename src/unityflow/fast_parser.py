@@ -31,6 +31,12 @@ DOCUMENT_HEADER_PATTERN = re.compile(
     r"^--- !u!(\d+) &(\d+)(?: stripped)?$", re.MULTILINE
 )
 
+# Bytes-level variant of the header pattern for scanning files without
+# decoding them (the optional \r tolerates CRLF line endings)
+DOCUMENT_HEADER_PATTERN_BYTES = re.compile(
+    rb"^--- !u!(\d+) &(\d+)(?: stripped)?\r?$", re.MULTILINE
+)
+
 # Pattern to match Unity GUIDs (32 hexadecimal characters)
 # This is used to prevent GUIDs like "0000000000000000e000000000000000" from being
 # parsed as scientific notation floats (0e000000000000000 = 0.0)
@@ -384,9 +390,11 @@ def get_file_stats(file_path: str | Path) -> dict[str, Any]:
     doc_count = 0
     class_counts: dict[int, int] = {}
 
-    with open(file_path, "r", encoding="utf-8") as f:
+    # Scan in binary with the precompiled bytes pattern - header counting
+    # doesn't need the UTF-8 decode of the whole file that text mode pays
+    with open(file_path, "rb") as f:
         for line in f:
-            match = DOCUMENT_HEADER_PATTERN.match(line)
+            match = DOCUMENT_HEADER_PATTERN_BYTES.match(line)
             if match:
                 doc_count += 1
                 class_id = int(match.group(1))
@@ -7,6 +7,7 @@ with round-trip fidelity through _rawFields preservation.
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -1485,9 +1486,7 @@ def get_summary(doc: UnityYAMLDocument) -> dict[str, Any]:
     Useful for providing LLMs with an overview before sending full details.
     """
     # Count by type
-    type_counts: dict[str, int] = {}
-    for obj in doc.objects:
-        type_counts[obj.class_name] = type_counts.get(obj.class_name, 0) + 1
+    type_counts = dict(Counter(obj.class_name for obj in doc.objects))
 
     # Build hierarchy
     hierarchy: list[str] = []
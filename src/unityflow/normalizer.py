@@ -91,16 +91,43 @@ class UnityPrefabNormalizer:
             from unityflow.asset_tracker import find_unity_project_root
             self.project_root = find_unity_project_root(input_path)
 
-        doc = UnityYAMLDocument.load(input_path)
+        doc = UnityYAMLDocument.load_auto(input_path)
         self.normalize_document(doc)
 
         content = doc.dump()
 
         if output_path:
-            Path(output_path).write_text(content, encoding="utf-8", newline="\n")
+            # Pre-encoded write_bytes skips the text layer's newline
+            # translation pass; content already uses LF line endings
+            Path(output_path).write_bytes(content.encode("utf-8"))
 
         return content
 
+    def normalize_file_streaming(
+        self, input_path: str | Path, output_path: str | Path
+    ) -> None:
+        """Normalize a Unity YAML file, writing the output incrementally.
+
+        Unlike normalize_file, this never materializes the full normalized
+        content as a single string: the input is parsed in streaming mode
+        and the result is emitted line by line. Use this for large scene
+        files where peak memory matters.
+
+        Args:
+            input_path: Path to the input file
+            output_path: Path to save the normalized file
+        """
+        input_path = Path(input_path)
+
+        # Auto-detect project root if not specified
+        if self.project_root is None:
+            from unityflow.asset_tracker import find_unity_project_root
+            self.project_root = find_unity_project_root(input_path)
+
+        doc = UnityYAMLDocument.load_auto(input_path)
+        self.normalize_document(doc)
+        doc.save_streaming(output_path)
+
     def normalize_document(self, doc: UnityYAMLDocument) -> None:
         """Normalize a UnityYAMLDocument in place.
 
@@ -391,6 +418,14 @@ class UnityPrefabNormalizer:
         self, value: Any, parent_key: str | None = None, property_path: str = ""
     ) -> Any:
         """Recursively normalize a value."""
+        # Fast path for the most common leaf types - exact type checks skip
+        # the isinstance cascade below, which dominates on large documents
+        value_type = type(value)
+        if value_type is int or value_type is str:
+            return value
+        if value_type is float:
+            return self._normalize_float(value)
+
         if isinstance(value, dict):
             # Check if this is a quaternion
             if parent_key in QUATERNION_PROPERTIES:
@@ -450,9 +485,13 @@ class UnityPrefabNormalizer:
         if w < 0:
             x, y, z, w = -x, -y, -z, -w
 
-        # Normalize to unit length
-        length = math.sqrt(x * x + y * y + z * z + w * w)
-        if length > 0:
+        # Normalize to unit length. Unity-authored quaternions are almost
+        # always unit already, so skip the sqrt and divisions when the
+        # squared length is within tolerance of 1 - the correction would be
+        # far below the float rounding precision anyway.
+        length_sq = x * x + y * y + z * z + w * w
+        if length_sq > 0 and abs(length_sq - 1.0) > 1e-12:
+            length = math.sqrt(length_sq)
             x /= length
             y /= length
             z /= length
@@ -481,11 +520,10 @@ class UnityPrefabNormalizer:
 
     def _normalize_float(self, value: float) -> float:
         """Normalize a float value to consistent representation."""
-        # Handle special cases
-        if math.isnan(value):
-            return float("nan")
-        if math.isinf(value):
-            return float("inf") if value > 0 else float("-inf")
+        # NaN/inf pass through unchanged; value != value is the cheapest
+        # NaN test and avoids two math-module calls per float
+        if value != value or value in (math.inf, -math.inf):
+            return value
 
         # Round to specified precision
         rounded = round(value, self.float_precision)
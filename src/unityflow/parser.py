@@ -481,7 +481,9 @@ class UnityYAMLDocument:
         """Save the document to a file."""
         path = Path(path)
         content = self.dump()
-        path.write_text(content, encoding="utf-8", newline="\n")
+        # dump() emits LF line endings; write the encoded bytes directly so
+        # no newline translation or second encode pass is needed
+        path.write_bytes(content.encode("utf-8"))
 
     def save_streaming(self, path: str | Path) -> None:
         """Save the document to a file using streaming mode.
@@ -494,9 +496,9 @@ class UnityYAMLDocument:
         """
         path = Path(path)
         with open(path, "w", encoding="utf-8", newline="\n") as f:
-            for line in self.iter_dump():
-                f.write(line)
-                f.write("\n")
+            # Single writelines call lets the buffered writer batch the many
+            # small per-line writes instead of paying two write calls per line
+            f.writelines(f"{line}\n" for line in self.iter_dump())
 
     @staticmethod
     def get_stats(path: str | Path) -> dict[str, Any]:
@@ -140,9 +140,10 @@ class PrefabValidator:
             )
             return ValidationResult(path=str(path), is_valid=False, issues=issues)
 
-        # Try to parse the file
+        # Try to parse the file (load_auto streams files over the large-file
+        # threshold instead of reading them into one string)
         try:
-            doc = UnityYAMLDocument.load(path)
+            doc = UnityYAMLDocument.load_auto(path)
         except Exception as e:
             issues.append(
                 ValidationIssue(
@@ -64,6 +64,20 @@ class TestNormalizeCommand:
 
         assert result.exit_code == 0
 
+    def test_normalize_directory(self, runner, tmp_path):
+        """Test that a directory argument fans out to Unity files under it."""
+        subdir = tmp_path / "Prefabs"
+        subdir.mkdir()
+        content = (FIXTURES_DIR / "unsorted_prefab.prefab").read_text()
+        (subdir / "a.prefab").write_text(content)
+        (subdir / "b.prefab").write_text(content)
+        (subdir / "notes.txt").write_text("not a unity file")
+
+        result = runner.invoke(main, ["normalize", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "2 normalized" in result.output
+
     def test_normalize_invalid_file(self, runner):
         """Test normalizing a non-existent file."""
         result = runner.invoke(
@@ -249,6 +263,23 @@ class TestGitTextconvCommand:
         # The normalized output should have documents in fileID order
         assert "%YAML 1.1" in result.output
 
+    def test_git_textconv_cached_output_identical(self, runner, tmp_path, monkeypatch):
+        """Test that a cache hit produces the same output as a cold run."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        args = ["git-textconv", str(FIXTURES_DIR / "unsorted_prefab.prefab")]
+
+        first = runner.invoke(main, args)
+        assert first.exit_code == 0
+
+        # Second run should be served from the cache
+        cache_entries = list((tmp_path / "unityflow" / "textconv").glob("*/*"))
+        assert len(cache_entries) == 1
+
+        second = runner.invoke(main, args)
+        assert second.exit_code == 0
+        assert second.output == first.output
+
 
 class TestMergeCommand:
     """Tests for the merge command."""